@@ -2,6 +2,22 @@
 Beamz9000: Plot a beam diagram. Send it for analysis in your engine of choice.
 """
 __version__ = "0.0.1"
-from beamz9000.model import Label, Node, Support, Fixity, Joint, Load, Beam
-from beamz9000.beam_plotter import BeamPlotter
-from beamz9000 import beam_plotter, constructors, model, svg_to_path, graphics
\ No newline at end of file
+from beamz9000.model import Label, Node, Support, Fixity, Joint, Load, LoadKind, Beam
+from beamz9000 import constructors, model
+import importlib
+
+# The plotting modules import matplotlib so they are only imported on first access
+_LAZY_SUBMODULES = ("beam_plotter", "graphics", "svg_to_path")
+
+__all__ = [
+    "Label", "Node", "Support", "Fixity", "Joint", "Load", "LoadKind", "Beam", "BeamPlotter",
+    "beam_plotter", "constructors", "model", "svg_to_path", "graphics",
+]
+
+
+def __getattr__(name: str):
+    if name == "BeamPlotter":
+        return importlib.import_module("beamz9000.beam_plotter").BeamPlotter
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"beamz9000.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
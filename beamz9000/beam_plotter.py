@@ -1,23 +1,91 @@
-from typing import Union, Optional
-import matplotlib.pyplot as plt
+from __future__ import annotations
+from typing import Union, Optional, TYPE_CHECKING
 from matplotlib.path import Path
 from matplotlib.patches import PathPatch
+from matplotlib.collections import PatchCollection, PathCollection
+from matplotlib.lines import Line2D
+from matplotlib.transforms import IdentityTransform
 import matplotlib as mpl
 import numpy as np
+import functools
+import os
 import pathlib
-from beamz9000.model import Label, Node, Support, Fixity, Joint, Beam, Load
+from beamz9000.model import Label, Node, Support, Fixity, Joint, Beam, Load, LoadKind
 import beamz9000.graphics as graphics
 import beamz9000.svg_to_path as svg_to_path
-import copy
 
-    # H_ROLLER = 0
-    # V_ROLLER = 1
-    # PINNED = 2
-    # FIXED = 3
-    # H_SPRING = 4
-    # V_SPRING = 5
-    # M_SPRING = 6
-    # T_SPRING = 7
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+# Each style is a directory containing "svg_supports" and "misc" SVG directories
+_STYLES_DIR = pathlib.Path(__file__).parent
+_DIM_TICK_SVG_NAME = "DIM_TICK.svg"
+# SVG file names of the supports, indexed by int(Fixity)
+_SUPPORT_SVG_NAMES = (
+    "H_ROLLER.svg",
+    "V_ROLLER.svg",
+    "PINNED.svg",
+    "FIXED.svg",
+    "H_SPRING.svg",
+    "V_SPRING.svg",
+    "M_SPRING.svg",
+    "T_SPRING.svg",
+)
+
+
+def _path_patch_defaults() -> dict:
+    """
+    Returns the properties where the defaults of a PathPatch and a Collection
+    differ, so that glyphs drawn as a collection look like the individual
+    PathPatch objects before the caller's styling is applied.
+    """
+    return {
+        "edgecolor": mpl.rcParams["patch.edgecolor"], 
+        "joinstyle": "miter", 
+        "capstyle": "butt",
+    }
+
+
+def _get_anchored_svg_path(style: str, fixity: Optional[int] = None) -> Path:
+    """
+    Returns the support path for 'fixity' in 'style' (or the dimension tick path
+    if 'fixity' is None) flipped, anchored and scaled into display units (see
+    graphics.anchor_svg_path). The result is computed once per version of the SVG
+    file and shared, read-only, between every support of the same fixity and
+    between plots.
+    """
+    if fixity is None:
+        svg_filepath = _STYLES_DIR / style / "misc" / _DIM_TICK_SVG_NAME
+        anchor_location, scale_factor = "center center", 1
+    else:
+        svg_filepath = _STYLES_DIR / style / "svg_supports" / _SUPPORT_SVG_NAMES[int(fixity)]
+        anchor_location, scale_factor = "top center", 2
+    resolved_filepath = os.fspath(svg_filepath.resolve())
+    return _anchor_svg_file(
+        resolved_filepath, 
+        os.stat(resolved_filepath).st_mtime_ns, 
+        anchor_location, 
+        scale_factor,
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _anchor_svg_file(
+    svg_filepath: str, 
+    mtime_ns: int, 
+    anchor_location: str, 
+    scale_factor: float,
+    ) -> Path:
+    """
+    Returns the anchored path of the SVG file at the absolute path 'svg_filepath'.
+    Cached on the modification time of the file ('mtime_ns'), as with
+    svg_to_path.load_svg_path_data, so that an edited file is re-anchored.
+    """
+    path_data = svg_to_path.load_svg_path_data(svg_filepath)
+    return graphics.anchor_svg_path(
+        PathPatch(Path(*path_data)), anchor_location, scale_factor, readonly=True
+    )
+
 
 class BeamPlotter:
     """
@@ -26,19 +94,7 @@ class BeamPlotter:
     def __init__(self, beam: Beam):
         self.beam = beam
         self.style = 'default'
-        self.support_svgs = {
-            0: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "H_ROLLER.svg",
-            1: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "V_ROLLER.svg",
-            2: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "PINNED.svg",
-            3: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "FIXED.svg",
-            4: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "H_SPRING.svg",
-            5: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "V_SPRING.svg",
-            6: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "M_SPRING.svg",
-            7: pathlib.Path(__file__).parent / self.style / "svg_supports"  / "T_SPRING.svg",
-        }
-        self.misc_svgs = {
-            "DIM_TICKS": pathlib.Path(__file__).parent / self.style / "misc"  / "DIM_TICK.svg",
-        }
+        self._color_cycle = list(mpl.rcParams['axes.prop_cycle'].by_key()['color'])
         self.strata = {
             "max_load_depth": self.beam.depth * 4/3 or self.beam.length / 10,
             "beam_top": self.beam.depth / 2,
@@ -51,44 +107,73 @@ class BeamPlotter:
         }
         
 
-    def plot(self, style='default', **kwargs):
-        fig, ax = self.init_plot()
-        fig, ax = self.add_beam_plot(fig, ax, **kwargs)
-        fig, ax = self.add_loads(fig, ax, **kwargs)
+    def plot(self, style='default', fig=None, ax=None, **kwargs):
+        """
+        Returns fig, ax with the beam plotted. If 'ax' (or only 'fig') is given,
+        the axes are cleared and re-used instead of creating a new figure.
+        """
+        spans = np.asarray(self.beam.get_spans(), dtype=np.float64)
+        length = float(spans.sum())
+        fig, ax = self.init_plot(fig, ax)
+        fig, ax = self.add_beam_plot(fig, ax, length=length, **kwargs)
+        fig, ax = self.add_loads(fig, ax, length=length, **kwargs)
         fig, ax = self.add_beam_supports(fig, ax, **kwargs)
         fig, ax = self.add_node_labels(fig, ax, **kwargs)
-        fig, ax = self.add_dimensions(fig, ax, y_offset=-2, **kwargs)
+        fig, ax = self.add_dimensions(fig, ax, y_offset=-2, spans=spans, **kwargs)
         return fig, ax
 
     
-    def init_plot(self, **kwargs) -> tuple[plt.figure, plt.axes]:
+    def init_plot(self, fig=None, ax=None, **kwargs) -> tuple[plt.figure, plt.axes]:
         """
         Returns a matplotlib figure and axes
+        If 'ax' is given, it is cleared and returned with its figure instead of
+        creating a new figure. If only 'fig' is given, its current axes are used.
         """
+        if ax is None and fig is not None:
+            ax = fig.gca()
+        if ax is not None:
+            ax.clear()
+            ax.axis('equal')
+            return ax.figure, ax
+        import matplotlib.pyplot as plt
         fig_size = kwargs.get("figsize", (12, 6))
         dpi = kwargs.get("dpi", 300)
         fig, ax = plt.subplots(figsize=fig_size, dpi=dpi)
         ax.axis('equal')
         return fig, ax
 
-    def add_beam_plot(self, fig, ax, **kwargs) -> tuple[plt.figure, plt.axes]:
+    def add_beam_plot(self, fig, ax, length: Optional[float] = None, **kwargs) -> tuple[plt.figure, plt.axes]:
         """
         Returns a fig, ax of a new subplot for a beam
+        'length' can be passed to re-use a beam length that is already computed.
         """
-        beam_length = self.beam.length
+        beam_length = self.beam.length if length is None else length
+        half_depth = self.beam.depth / 2
         
         if not self.beam.depth:
-            beam_x_ords = [0, beam_length]
-            beam_y_ords = [0, 0]
+            vertices = np.array(
+                [[0.0, 0.0], [beam_length, 0.0]], 
+                dtype=np.float64,
+            )
         else:
-            beam_x_ords = [0]*2 + [beam_length]*3 + [0]*2
-            beam_y_ords = [0] + [self.beam.depth/2]*2 + [0] + [-self.beam.depth/2]*2 + [0]
+            vertices = np.array(
+                [
+                    [0.0, 0.0],
+                    [0.0, half_depth],
+                    [beam_length, half_depth],
+                    [beam_length, 0.0],
+                    [beam_length, -half_depth],
+                    [0.0, -half_depth],
+                    [0.0, 0.0],
+                ], 
+                dtype=np.float64,
+            )
 
-        vertices = np.array(list(zip(beam_x_ords, beam_y_ords)))
         path = Path(vertices=vertices)
         path_patch = PathPatch(path, **kwargs)
-         # Background beam plot to automatically set axes extents ## HACK
-        ax.plot(beam_x_ords, beam_y_ords, alpha=0)
+        # Expand the axes extents to the beam without adding a hidden artist
+        ax.update_datalim(vertices)
+        ax.autoscale_view()
         ax.add_patch(path_patch)
         return fig, ax
 
@@ -96,62 +181,92 @@ class BeamPlotter:
         """
         Returns a fig, ax with supports added
         """
-        lower_extent = 0
-        for support in self.beam.supports:
-            support_patch = svg_to_path.load_svg_file(self.support_svgs[int(support.fixity)])
-            translation = graphics.get_svg_translation_transform(
-                ax,
-                support_patch,
-                (support.location.x, -self.beam.depth/2),
-                "top center",
-                2
-            )
-            support_patch.set_transform(translation)
-            support_patch.set(**kwargs)
-            ax.add_patch(support_patch)
+        # The flip/anchor/scale transform only depends on the fixity so each
+        # unique support path is anchored once and shared between supports
+        style = self.style
+        support_y = self.strata["beam_bottom"]
+        # The glyphs and the labels are both placed from the support arrays kept
+        # on the beam (see Beam.invalidate) so they cannot drift apart
+        support_x = self.beam._support_x
+        support_fixity = self.beam._support_fixity
+        anchored_paths = {
+            fixity: _get_anchored_svg_path(style, fixity)
+            for fixity in np.unique(support_fixity).tolist()
+        }
+        support_paths = [anchored_paths[fixity] for fixity in support_fixity.tolist()]
 
-            ## Add node label
-            if support.location.label.text is not None:
+        ## Add node labels
+        for support, x in zip(self.beam.supports, support_x.tolist()):
+            label_text = support.location.label.text
+            if label_text is not None:
                 ax.annotate(
-                    f"{support.location.label.text}",
-                    xy=(support.location.x, -self.beam.depth/2),
+                    label_text if isinstance(label_text, str) else str(label_text),
+                    xy=(x, support_y),
                     horizontalalignment='center',
                     size=14
                 )
+
+        # One collection for all supports: the paths are in display units and
+        # each support is placed by its data offset
+        if support_paths:
+            support_offsets = np.empty((len(support_x), 2), dtype=np.float64)
+            support_offsets[:, 0] = support_x
+            support_offsets[:, 1] = support_y
+            support_collection = PathCollection(
+                support_paths,
+                offsets=support_offsets,
+                offset_transform=ax.transData,
+                transform=IdentityTransform(),
+            )
+            support_collection.set(**_path_patch_defaults())
+            support_collection.set(**kwargs)
+            ax.add_collection(support_collection)
         return fig, ax
 
 
-    def add_loads(self, fig, ax, **kwargs) -> tuple[plt.figure, plt.axes]:
+    def add_loads(self, fig, ax, length: Optional[float] = None, **kwargs) -> tuple[plt.figure, plt.axes]:
         """
         Returns fig, ax with load graphics added
+        'length' can be passed to re-use a beam length that is already computed.
         """
-        prop_cycle = mpl.rc_params()['axes.prop_cycle']
-        colors = prop_cycle.by_key()['color']
+        if not self.beam.loads:
+            return fig, ax
+        beam_length = self.beam.length if length is None else length
+        colors = self._color_cycle
         max_load_depth = self.strata['max_load_depth']
-        scaling_loads = max_load_magnitudes(self.beam.loads)
-        load_labels = list(sorted(set(load.label.text for load in self.beam.loads)))
+        load_types = classify_loads(self.beam.loads)
+        scaling_loads = max_load_magnitudes(self.beam.loads, load_types)
+        load_labels = sorted(set(load.label.text for load in self.beam.loads))
         load_colors = {label_text: colors[idx] for idx, label_text in enumerate(load_labels)}
         y = self.strata['beam_top']
-        for load in self.beam.loads:
-            load_type = classify_load(load)
-            display_magnitude = get_scaled_magnitude(load, scaling_loads, max_load_depth)
-            if load_type == "POINT":
+        start_depths, end_depths, load_types = scaled_magnitudes(
+            self.beam.loads, scaling_loads, max_load_depth, load_types
+        )
+        load_patches = []
+        for load, start_depth, end_depth, load_type_code in zip(
+            self.beam.loads, start_depths, end_depths, load_types
+        ):
+            if load_type_code == LoadKind.POINT:
                 x = load.start_location
                 arrow_patch = graphics.arrow_at_coordinate(
                     point=(x, y), 
-                    magnitude=display_magnitude, 
+                    magnitude=start_depth, 
                     angle=load.alpha,
                     color=load_colors.get(load.label.text),
                     **kwargs
                 )
-                ax.add_patch(arrow_patch)
-            elif load_type == "DISTRIBUTED":
-                try:
-                    start_magnitude, end_magnitude = display_magnitude
-                except TypeError:
-                    start_magnitude = end_magnitude = display_magnitude
+                if kwargs:
+                    # match_original only carries the colours, line width, line style
+                    # and antialiasing of a patch so anything else set by the caller
+                    # (e.g. zorder, hatch) would be lost in the collection
+                    ax.add_patch(arrow_patch)
+                else:
+                    load_patches.append(arrow_patch)
+            elif load_type_code == LoadKind.DISTRIBUTED:
+                start_magnitude = start_depth
+                end_magnitude = start_depth if np.isnan(end_depth) else end_depth
                 polygon_patch, arrows = graphics.distributed_load_region(
-                    self.beam.length, 
+                    beam_length, 
                     start_magnitude,
                     load.start_location, 
                     end_magnitude,
@@ -160,50 +275,83 @@ class BeamPlotter:
                     load_colors.get(load.label.text), 
                     **kwargs,
                 )
-                ax.add_patch(polygon_patch)
-                for arrow_patch in arrows:
-                    ax.add_patch(arrow_patch)
-            
+                load_patches.append(polygon_patch)
+                load_patches.extend(arrows)
+
+        # A single collection updates the data limits once instead of once per patch
+        if load_patches:
+            ax.add_collection(PatchCollection(load_patches, match_original=True))
         return fig, ax
 
 
-    def add_dimensions(self, fig, ax, y_offset=0, **kwargs) -> tuple[plt.figure, plt.axes]:
+    def add_dimensions(
+        self, 
+        fig, 
+        ax, 
+        y_offset=0, 
+        spans: Optional[np.ndarray] = None, 
+        **kwargs
+        ) -> tuple[plt.figure, plt.axes]:
         """
         Returns fig, ax with dimension graphics added
+        'spans' can be passed to re-use beam spans that are already computed.
         """
-        dim_tick_patch = svg_to_path.load_svg_file(self.misc_svgs["DIM_TICKS"])
-        paths = []
-        ticks = []
-        for node in self.beam.dimensions:
-            paths.append([node.x, y_offset])
-
-            # Plot ticks
-            dim_tick = copy.deepcopy(dim_tick_patch)
-            transform = graphics.get_svg_translation_transform(
-                ax,
-                dim_tick_patch, 
-                (node.x, y_offset), 
-                "center center", 
-                scale_factor=1, 
-            )
-            dim_tick.set_transform(transform)
-            dim_tick.set(**kwargs)
-            dim_tick.set_zorder(-3)
-            ax.add_patch(dim_tick)
+        if spans is None:
+            spans = np.asarray(self.beam.get_spans(), dtype=np.float64)
+        tick_path = _get_anchored_svg_path(self.style)
+        # Plot ticks: every tick is the same path, placed by its data offset
+        tick_xs = np.fromiter(
+            (node.x for node in self.beam.dimensions), 
+            dtype=np.float64, 
+            count=len(self.beam.dimensions)
+        )
+        tick_offsets = np.empty((len(tick_xs), 2), dtype=np.float64)
+        tick_offsets[:, 0] = tick_xs
+        tick_offsets[:, 1] = y_offset
+        tick_collection = PathCollection(
+            [tick_path],
+            offsets=tick_offsets,
+            offset_transform=ax.transData,
+            transform=IdentityTransform(),
+        )
+        tick_collection.set(**_path_patch_defaults())
+        tick_collection.set(**kwargs)
+        tick_collection.set_zorder(-3)
+        ax.add_collection(tick_collection)
 
         # Plot dim labels
-        prev_span = 0
-        for span in self.beam.get_spans():
+        span_edges = np.concatenate([[0.0], np.cumsum(spans)])
+        span_centers = span_edges[:-1] + spans / 2
+        label_y = y_offset - 1
+        # Whole spans are printed without a trailing ".0", other spans in full
+        span_labels = [
+            str(int(span)) if span.is_integer() else repr(span) 
+            for span in spans.tolist()
+        ]
+        for span_center, span_label in zip(span_centers, span_labels):
             ax.annotate(
-                f"{span}",
-                xy=(prev_span + span/2, y_offset-1),
+                span_label,
+                xy=(span_center, label_y),
                 horizontalalignment='center',
                 size=14
             )
-            prev_span += span
-        path = Path(np.array(paths))
-        path_patch = PathPatch(path, **kwargs)
-        ax.add_patch(path_patch)
+        # The line is drawn with the edge colour the kwargs give a patch; the
+        # remaining kwargs are passed on where they also apply to a line
+        dim_tick_patch = PathPatch(tick_path, **kwargs)
+        dimension_line = Line2D(
+            tick_offsets[:, 0], 
+            tick_offsets[:, 1],
+            color=dim_tick_patch.get_edgecolor(),
+            linewidth=dim_tick_patch.get_linewidth(),
+            linestyle=dim_tick_patch.get_linestyle(),
+        )
+        dimension_line.set(
+            **{
+                name: value for name, value in kwargs.items() 
+                if name != "color" and hasattr(dimension_line, f"set_{name}")
+            }
+        )
+        ax.add_line(dimension_line)
         return fig, ax
 
 
@@ -227,6 +375,10 @@ class BeamPlotter:
             return str(label)
 
 
+# Load category names, indexed by LoadKind
+LOAD_TYPES = tuple(load_kind.name for load_kind in LoadKind)
+
+
 def get_relative_load_depths(self, loads: list[Load]) -> dict[Optional[float]]:
     """
     Returns a list representing the relative maximum magnitudes of the loads
@@ -247,12 +399,16 @@ def get_relative_load_depths(self, loads: list[Load]) -> dict[Optional[float]]:
 
 def get_max_magnitude(loads: list[Load]) -> Load:
     """
-    Returns the Load with the absolute maximume load magnitude from all of the Load in 'loads'.
+    Returns the Load with the absolute maximum load magnitude from all of the Load in 'loads'.
     """
-    start_magnitude = max(loads, key=lambda x: abs(x.magnitude))
-    end_magnitude = max(loads, key=lambda x: abs(x.end_magnitude) if x.end_magnitude else 0)
-    max_magnitude = max([start_magnitude, end_magnitude or 0])
-    return max_magnitude
+    max_magnitude = -1.0
+    max_magnitude_load = None
+    for load in loads:
+        current_magnitude = max(abs(load.magnitude), abs(load.end_magnitude or 0.0))
+        if current_magnitude > max_magnitude:
+            max_magnitude = current_magnitude
+            max_magnitude_load = load
+    return max_magnitude_load
 
 
 def classify_load(load: Load) -> str:
@@ -261,30 +417,43 @@ def classify_load(load: Load) -> str:
     Load categories:
     "POINT", "DISTRIBUTED", "POINT_MOMENT",
     """
-    if load.moment:
-        return "POINT_MOMENT"
-    elif load.end_location is not None:
-        return "DISTRIBUTED"
-    else:
-        return "POINT"
+    return load.kind.name
+
+
+def classify_loads(loads: list[Load]) -> np.ndarray:
+    """
+    Returns an int8 array aligned with 'loads' of the LoadKind of each load.
+    """
+    return np.fromiter(
+        (load.kind for load in loads), 
+        dtype=np.int8, 
+        count=len(loads)
+    )
 
 
-def max_load_magnitudes(loads: list[Load]) -> dict[str, float]:
+def max_load_magnitudes(loads: list[Load], load_types: Optional[np.ndarray] = None) -> dict[str, float]:
     """
     Returns a dictionary representing the maximum magnitude for each 
     load category in 'loads'.
     The load categories are "POINT", "DISTRIBUTED", "POINT_MOMENT".
+    'load_types' can be passed to re-use the result of classify_loads(loads).
     """
-    magnitudes = {"POINT": 0.0, "DISTRIBUTED": 0.0, "POINT_MOMENT": 0.0}
-    for load in loads:
-        load_type = classify_load(load)
-        comparison_magnitude = magnitudes.get(load_type)
-        scaling_magnitude = load.magnitude
-        if load.end_magnitude is not None:
-            if abs(load.end_magnitude) > abs(load.start_magnitude):
-                scaling_magnitude = abs(load.end_magnitude)
-        if comparison_magnitude < abs(scaling_magnitude):
-            magnitudes[load_type] = abs(scaling_magnitude)
+    if not loads:
+        return dict.fromkeys(LOAD_TYPES, 0.0)
+    if load_types is None:
+        load_types = classify_loads(loads)
+    magnitude = np.fromiter((load.magnitude for load in loads), dtype=np.float64, count=len(loads))
+    end_magnitude = np.fromiter(
+        (load.end_magnitude or 0.0 for load in loads), 
+        dtype=np.float64, 
+        count=len(loads)
+    )
+
+    scaling_magnitude = np.abs(np.where(np.abs(end_magnitude) > np.abs(magnitude), end_magnitude, magnitude))
+    magnitudes = {
+        load_type: float(scaling_magnitude[load_types == type_code].max(initial=0.0))
+        for type_code, load_type in enumerate(LOAD_TYPES)
+    }
     return magnitudes
 
 
@@ -297,26 +466,45 @@ def get_scaled_magnitude(load: Load, max_magnitudes: dict, max_depth: float) ->
     representing the start and end magnitude.
     If 'load' is of category "POINT" or "POINT_MOMENT" then it will return a float
     representing the magnitude.
-    """        
-    load_type = classify_load(load)
-    if load_type == "POINT":
-        scaling_load = abs(load.magnitude)
-        scaling_factor = abs(scaling_load / max_magnitudes[load_type])
-        load_depth = scaling_factor * max_depth
-        return load_depth
-    elif load_type == "DISTRIBUTED":
-        start_scaling_load = abs(load.magnitude)
-        end_scaling_load = abs(load.end_magnitude) if load.end_magnitude is not None else None
-        start_scaling_factor = abs(start_scaling_load / max_magnitudes[load_type])
-        if end_scaling_load is not None:
-            end_scaling_factor = abs(end_scaling_load / max_magnitudes[load_type])
-        start_load_depth = start_scaling_factor * max_depth
-        if end_scaling_load is not None:
-            end_load_depth = end_scaling_factor * max_depth
-        if end_scaling_load is not None:
-            return (start_load_depth, end_load_depth)
-        
-        return start_load_depth
-    elif load_type == "POINT_MOMENT":
-        load_depth = scaling_factor * max_depth
-        return load_depth
+    """
+    start_depths, end_depths, load_types = scaled_magnitudes([load], max_magnitudes, max_depth)
+    start_depth = float(start_depths[0])
+    if np.isnan(end_depths[0]):
+        return start_depth
+    return (start_depth, float(end_depths[0]))
+
+
+def scaled_magnitudes(
+    loads: list[Load], 
+    max_magnitudes: dict, 
+    max_depth: float,
+    load_types: Optional[np.ndarray] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns a tuple of three arrays aligned with 'loads': (start_depth, end_depth, load_type).
+    The depths are the load magnitudes scaled according to the maximum magnitude of their
+    category in 'max_magnitudes' and according to 'max_depth' which is effectively
+    the maximum magnitude a load can have in figure space.
+    end_depth is NaN for loads that do not have an end_magnitude.
+    load_type is an int8 array of the LoadKind of each load.
+    'load_types' can be passed to re-use the result of classify_loads(loads).
+    """
+    n_loads = len(loads)
+    magnitude = np.fromiter((load.magnitude for load in loads), dtype=np.float64, count=n_loads)
+    end_magnitude = np.fromiter(
+        (np.nan if load.end_magnitude is None else load.end_magnitude for load in loads),
+        dtype=np.float64,
+        count=n_loads,
+    )
+    if load_types is None:
+        load_types = classify_loads(loads)
+    type_max = np.array([max_magnitudes[load_type] for load_type in LOAD_TYPES], dtype=np.float64)
+    load_max = type_max[load_types]
+    scale = np.divide(max_depth, load_max, out=np.zeros(n_loads), where=load_max > 0)
+    start_depth = np.abs(magnitude) * scale
+    end_depth = np.where(
+        np.isnan(end_magnitude) | (load_types != LoadKind.DISTRIBUTED), 
+        np.nan, 
+        np.abs(end_magnitude) * scale
+    )
+    return start_depth, end_depth, load_types
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Optional
 import math
 from matplotlib.path import Path
 import matplotlib.patches as patches
@@ -7,18 +7,31 @@ import matplotlib.axes as axes
 import numpy as np
 
 
+# Shared flip transform for SVG coordinates (see get_svg_flip_transform). Do not mutate.
+SVG_FLIP = transforms.Affine2D().scale(1, -1)
+
+
+# Fraction of the bounding box (x, y) selected by each anchor word. None leaves the
+# axis at its default of 0.5 (center).
+_ANCHOR_FRACTIONS = {
+    "top": (None, 1.0),
+    "bottom": (None, 0.0),
+    "left": (0.0, None),
+    "right": (1.0, None),
+    "center": (None, None),
+}
+
 
 def get_svg_size(ax: axes.Axes, path_patch: patches.PathPatch):
     """
     Returns the depth (y-dimension) of 'path_patch' when transformed into
     the data-space coordinate system in 'ax'.
     """
-    ymin = get_extent(path_patch, "y", "min")
-    ymax = get_extent(path_patch, "y", "max")
-    xmin = get_extent(path_patch, "x", "min")
-    xmax = get_extent(path_patch, "x", "max")
-    x_min_data, y_min_data = ax.transData.inverted().transform([xmin, ymin])
-    x_max_data, y_max_data = ax.transData.inverted().transform([xmax, ymax])
+    bbox = path_patch.get_extents()
+    display_to_data = ax.transData.inverted()
+    (x_min_data, y_min_data), (x_max_data, y_max_data) = display_to_data.transform(
+        np.array([[bbox.xmin, bbox.ymin], [bbox.xmax, bbox.ymax]])
+    )
     y_range = abs(y_max_data - y_min_data)
     x_range = abs(x_max_data - x_min_data)
     return x_range, y_range
@@ -43,15 +56,65 @@ def get_svg_translation_transform(
         "top", "bottom", "left", "right", "center"
         e.g. "top left", "right bottom", "center center", "center right"
     """
-    svg_flip = get_svg_flip_transform()
-    path_patch.set_transform(svg_flip)
-    svg_anchor_x, svg_anchor_y = get_anchor_point(path_patch, anchor_location)
+    anchor_transform = get_svg_anchor_transform(path_patch, anchor_location, scale_factor)
     target_x, target_y = target
-    anchor_to_origin = transforms.Affine2D()
-    anchor_to_origin_transform = anchor_to_origin.translate(-svg_anchor_x, -svg_anchor_y)
-    scale_transform = get_scale_transform(scale_factor)
     translate_transform = transforms.ScaledTranslation(target_x, target_y, ax.transData)
-    return svg_flip + anchor_to_origin_transform + scale_transform + translate_transform
+    return anchor_transform + translate_transform
+
+
+def get_svg_anchor_transform(
+    path_patch: patches.PathPatch = None,
+    anchor_location: str = None,
+    scale_factor: float = None,
+    ) -> transforms.Transform:
+    """
+    Returns a matplotlib.transform.Transform that flips 'path_patch' into the correct
+    orientation, moves its 'anchor_location' to the origin, and scales it by 'scale_factor'.
+    The returned transform is in display units and is intended to be combined with an
+    offset in data space (e.g. the offsets of a matplotlib.collections.Collection).
+
+    path_patch: a matplotlib PathPatch object
+    anchor_location: a string that is two of the following words separated by a space.
+        "top", "bottom", "left", "right", "center"
+        e.g. "top left", "right bottom", "center center", "center right"
+    """
+    path_patch.set_transform(SVG_FLIP)
+    svg_anchor_x, svg_anchor_y = get_anchor_point(path_patch, anchor_location)
+    # flip + anchor_to_origin + scale folded into a single matrix:
+    # x' = s * (x - anchor_x), y' = s * (-y - anchor_y)
+    sx = scale_factor
+    sy = -scale_factor
+    tx = -svg_anchor_x * scale_factor
+    ty = -svg_anchor_y * scale_factor
+    matrix = np.array(
+        [
+            [sx, 0.0, tx],
+            [0.0, sy, ty],
+            [0.0, 0.0, 1.0],
+        ]
+    )
+    return transforms.Affine2D(matrix)
+
+
+def anchor_svg_path(
+    path_patch: patches.PathPatch,
+    anchor_location: str,
+    scale_factor: float,
+    readonly: bool = False,
+    ) -> Path:
+    """
+    Returns a new matplotlib.path.Path of 'path_patch' with the transform of
+    get_svg_anchor_transform baked into its vertices (display units). The
+    returned path needs no transform of its own and can be placed with a
+    data-space offset.
+
+    readonly: if True, the returned path (and its vertices) cannot be modified
+        so that it can be safely shared between artists.
+    """
+    matrix = get_svg_anchor_transform(path_patch, anchor_location, scale_factor).get_matrix()
+    path = path_patch.get_path()
+    vertices = path.vertices @ matrix[:2, :2].T + matrix[:2, 2]
+    return Path(vertices, path.codes, readonly=readonly)
 
 
 def get_svg_flip_transform() -> transforms.Transform:
@@ -97,39 +160,57 @@ def get_anchor_point(path_patch: patches.PathPatch, location: str) -> tuple[floa
         "top", "bottom", "left", "right", "center"
         e.g. "top left", "right bottom", "center center", "center right"
     """
-    bbox = path_patch.get_extents()
-    xmin, ymin, xmax, ymax = bbox.xmin, bbox.ymin, bbox.xmax, bbox.ymax
-
-    if len(location.split()) != 2:
+    words = location.lower().split()
+    if len(words) != 2 or not all(word in _ANCHOR_FRACTIONS for word in words):
         raise ValueError(
             "'location' must be a string containing two words, separated by a space, describing a "
             "location relative to a bounding box, e.g. 'top left', 'bottom right', 'center right', 'bottom center'.\n"
             "Each word must be one of:\n'top', 'bottom', 'left', 'right', 'center'.\n"
             f"{location} was passed instead."
         )
-    location = location.lower()
-    if "center" in location:
-        x = (xmax + xmin) / 2
-        y = (ymax + ymin) / 2
-
-    if "right" in location:
-        x = xmax
-    elif "left" in location:
-        x = xmin
-    elif "top" in location:
-        y = ymax
-    elif "bottom" in location:
-        y = ymin
+    x_fraction = y_fraction = 0.5
+    for word in words:
+        word_x, word_y = _ANCHOR_FRACTIONS[word]
+        if word_x is not None:
+            x_fraction = word_x
+        if word_y is not None:
+            y_fraction = word_y
+
+    bbox = path_patch.get_extents()
+    x = bbox.xmin + (bbox.xmax - bbox.xmin) * x_fraction
+    y = bbox.ymin + (bbox.ymax - bbox.ymin) * y_fraction
     return x, y
 
 
-def arrow_at_coordinate(point: tuple, magnitude: float, angle: float, color, **params: dict):
+def get_arrow_direction(angle: float) -> tuple[float, float]:
+    """
+    Returns the (x, y) unit vector of an arrow at 'angle' degrees from vertical.
+    An angle of 0 (vertical, the most common case) skips the trigonometry.
+    """
+    if angle == 0:
+        return 0.0, 1.0
+    radians = math.radians(90 - angle)
+    return math.cos(radians), math.sin(radians)
+
+
+def arrow_at_coordinate(
+    point: tuple, 
+    magnitude: float, 
+    angle: float, 
+    color, 
+    direction: Optional[tuple[float, float]] = None,
+    **params: dict
+    ):
     """
     Returns ax with an arrow added to it that *points to* the coordinate ('x', 'y') with
     an arrow containing arrow_params.
+
+    direction: optional (x, y) unit vector of the arrow, as returned by
+        get_arrow_direction(angle), to avoid recomputing it for many arrows at the
+        same angle. Computed from 'angle' if not provided.
     """
     pt_x, pt_y = point
-    v_x, v_y = math.cos(math.radians(90 - angle)), math.sin(math.radians(90 - angle))
+    v_x, v_y = get_arrow_direction(angle) if direction is None else direction
     dx = -v_x * magnitude
     dy = -v_y * magnitude
     x = pt_x - dx
@@ -181,13 +262,27 @@ def distributed_load_region(
     )
     params = {"edgecolor": color, "facecolor": color, "alpha": 0.5}
     distributed_patch = patches.Polygon(xy=xy, closed=True, **params)
-    arrows = []
-    x_interval = region / (n_arrows - 1)
-    for arrow_idx in range(n_arrows):
-        x_coord = arrow_idx * x_interval + start_loc
-        arrow_magnitude = (end_magnitude - start_magnitude) / region * (x_coord - start_magnitude) + start_magnitude
-        arrow = arrow_at_coordinate(point=(x_coord, top_of_beam), magnitude=arrow_magnitude, angle=0, color=color, **params)
-        arrows.append(arrow)
+    x_coords = np.linspace(start_loc, end_loc, n_arrows)
+    # Linear interpolation written out as np.interp requires start_loc < end_loc
+    if end_loc == start_loc:
+        arrow_magnitudes = np.full_like(x_coords, start_magnitude)
+    else:
+        arrow_magnitudes = start_magnitude + (x_coords - start_loc) * (
+            (end_magnitude - start_magnitude) / (end_loc - start_loc)
+        )
+    angle = 0
+    direction = get_arrow_direction(angle)
+    arrows = [
+        arrow_at_coordinate(
+            point=(x_coord, top_of_beam), 
+            magnitude=arrow_magnitude, 
+            angle=angle, 
+            color=color, 
+            direction=direction, 
+            **params
+        )
+        for x_coord, arrow_magnitude in zip(x_coords.tolist(), arrow_magnitudes.tolist())
+    ]
 
     return distributed_patch, arrows
 
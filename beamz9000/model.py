@@ -1,14 +1,15 @@
 from __future__ import annotations
 from typing import Union, Optional
 from enum import IntEnum
-from dataclasses import dataclass, fields
-from matplotlib import pyplot
+import functools
+from dataclasses import dataclass, field, fields
+import numpy as np
  
 
 Number: Union[int, float]
 NUMBER = (float, int)
 
-@dataclass
+@dataclass(slots=True)
 class Label:
     """
     A generic class to define a label to be plotted.
@@ -34,7 +35,13 @@ class Label:
         return _alternate_dataclass_repr(self)
 
 
-@dataclass(order=True)
+# The label given to Nodes, Supports and Loads created without one. It is shared
+# between all of them so it must not be modified; use make_label() to create a new
+# Label to modify.
+_EMPTY_LABEL = Label()
+
+
+@dataclass(order=True, slots=True)
 class Node:
     """
     A generic location on a beam's local axis. Nodes can be used to
@@ -58,7 +65,7 @@ class Node:
         if isinstance(self.label, str):
             self.label = Label(self.label)
         elif self.label is None:
-            self.label = Label()
+            self.label = _EMPTY_LABEL
 
     def __str__(self):
         return _alternate_dataclass_repr(self)
@@ -90,7 +97,24 @@ class Fixity(IntEnum):
     M_SPRING = 5
 
 
-@dataclass
+class LoadKind(IntEnum):
+    """
+    The kind of a Load, as used for scaling and plotting loads.
+    POINT = 0
+    DISTRIBUTED = 1 # Load with an end_location
+    POINT_MOMENT = 2 # Load with moment=True
+
+    # Examples:
+    POINT = LoadKind(0)
+    DISTRIBUTED = LoadKind(1)
+    POINT_MOMENT = LoadKind(2)
+    """
+    POINT = 0
+    DISTRIBUTED = 1
+    POINT_MOMENT = 2
+
+
+@dataclass(slots=True)
 class Support:
     """
     A dataclass representing a support that may occur on a beam plot.
@@ -113,16 +137,18 @@ class Support:
 
     def __post_init__(self):
         if isinstance(self.location, NUMBER):
-            node = Node(self.location, label=Label(self.label))
+            node = Node(self.location, label=self.label)
             self.location = node
-        if self.label is None or isinstance(self.label, str):
+        if isinstance(self.label, str):
             self.label = Label(self.label)
+        elif self.label is None:
+            self.label = _EMPTY_LABEL
 
     def __str__(self):
         return _alternate_dataclass_repr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Joint:
     """
     A dataclass representing a joint that may occur on a beam plot.
@@ -143,7 +169,7 @@ class Joint:
         return _alternate_dataclass_repr(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Load:
     """
     A generic dataclass representing any kind of load that may occur on a beam plot.
@@ -191,13 +217,25 @@ class Load:
         if isinstance(self.label, str):
             self.label = Label(self.label)
         elif self.label is None:
-            self.label = Label()
+            self.label = _EMPTY_LABEL
 
     def __str__(self):
         return _alternate_dataclass_repr(self)
 
+    @property
+    def kind(self) -> LoadKind:
+        """
+        Returns the LoadKind of the load: POINT_MOMENT if moment=True,
+        DISTRIBUTED if an end_location is given, otherwise POINT.
+        """
+        if self.moment:
+            return LoadKind.POINT_MOMENT
+        elif self.end_location is not None:
+            return LoadKind.DISTRIBUTED
+        return LoadKind.POINT
+
 
-@dataclass
+@dataclass(slots=True)
 class Beam:
     """
     A dataclass representing a beam to plot.
@@ -243,11 +281,16 @@ class Beam:
     joints: Optional[list[Joint]] = None
     depth: Optional[Union[Number, list[Number]]] = None
     dimensions: Optional[list[Union[Node, Number, str]]] = None
+    _node_x: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _spans: Optional[list[float]] = field(default=None, init=False, repr=False, compare=False)
+    _length: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _support_x: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    _support_fixity: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         new_nodes = []
         for node in self.nodes:
-            if isinstance(node, (float, int)):
+            if isinstance(node, NUMBER):
                 new_node = Node(node, label=Label(f"{node}"))
                 new_nodes.append(new_node)
             elif hasattr(node, "label"):
@@ -256,27 +299,35 @@ class Beam:
                 new_nodes.append(node)
         self.nodes = new_nodes
 
+        # Index the nodes by label text once so that supports and dimensions
+        # given by label are resolved without scanning the nodes each time.
+        # The first node with a given label wins, as in _lookup_node.
+        label_index = {}
+        for node in self.nodes:
+            label_text = getattr(node.label, "text", None)
+            if label_text is not None:
+                label_index.setdefault(label_text, node)
+
         for support in self.supports:
             if isinstance(support.location, str):
-                node = _lookup_node(support, self.nodes)
+                node = label_index.get(support.location)
                 if node is None:
-                    raise ValueError(f"Support is at node with label: {support} but no node with this label exists.")
+                    raise ValueError(f"Support is at node with label: {support.location} but no node with this label exists.")
                 else:
                     support.location = node
+        self.invalidate()
 
         processed_dimensions = []
         for loc in self.dimensions:
             if isinstance(loc, Node):
                 processed_dimensions.append(loc)
             elif isinstance(loc, NUMBER):
-                node = Node(loc)
-                processed_dimensions.append(node)
+                processed_dimensions.append(Node(loc))
             elif isinstance(loc, str):
-                node = _lookup_node(loc, self.nodes)
+                node = label_index.get(loc)
                 if node is None:
                     raise ValueError(f"A dimension is given for a node with label: {loc} but no node with this label exists.")
-                else:
-                    processed_dimensions.append(node)
+                processed_dimensions.append(node)
         self.dimensions = processed_dimensions
         if self.depth is None:
             self.depth = 0
@@ -290,22 +341,34 @@ class Beam:
         Returns the list of spans that exist on the beam as defined by
         the node locations.
         """
-        spans = []
-        prev_loc = 0
-        for idx, node in enumerate(self.nodes):
-            if idx == 0:
-                prev_loc = node.x                
-            else:
-                current_span = abs(node.x - prev_loc)
-                spans.append(current_span)
-                prev_loc = node.x
-        return spans
+        return list(self._spans)
 
     @property
     def length(self):
-        beam_spans = self.get_spans()
-        beam_length = sum(beam_spans)
-        return beam_length
+        return self._length
+
+    def invalidate(self):
+        """
+        Recomputes the node coordinates, spans and length cached from 'nodes' and
+        the support locations and fixities cached from 'supports'.
+        Call this after modifying 'nodes' or 'supports' (or the location of a node,
+        or the location or fixity of a support) in place. Supports added this way
+        must already be located at a Node.
+        """
+        self._node_x = np.fromiter((node.x for node in self.nodes), dtype=np.float64, count=len(self.nodes))
+        span_array = np.abs(np.diff(self._node_x))
+        self._spans = span_array.tolist()
+        self._length = float(span_array.sum())
+        self._support_x = np.fromiter(
+            (support.location.x for support in self.supports), 
+            dtype=np.float64, 
+            count=len(self.supports)
+        )
+        self._support_fixity = np.fromiter(
+            (int(support.fixity) for support in self.supports), 
+            dtype=np.int8, 
+            count=len(self.supports)
+        )
 
 
 
@@ -323,17 +386,10 @@ def nodes_from_spans(
             f"of spans + 1. Span length: {len(spans)}, and, label length: {len(labels)} were passed."
             )
 
-    nodes = []
-    N00 = Node(0)
-    N00.label = make_label(labels.pop(0)) if labels else None
-
-    nodes.append(N00)
-    prev_span = 0
-    for idx, span in enumerate(spans):
-        label = make_label(labels[idx]) if labels else None
-        new_node = Node(span - prev_span, label)
-        nodes.append(new_node)
-    return nodes
+    node_xs = np.concatenate([[0.0], np.cumsum(np.asarray(spans, dtype=np.float64))]).tolist()
+    if not labels:
+        return [Node(x) for x in node_xs]
+    return [Node(x, make_label(label)) for x, label in zip(node_xs, labels)]
 
 
 
@@ -358,20 +414,31 @@ def _alternate_dataclass_repr(object) -> None:
     set to None. i.e. Only prints fields which have values.
     This is for ease of reading.
     """
-    populated_fields = {
-        field.name: getattr(object, f"{field.name}")
-        for field in fields(object)
-        if getattr(object, f"{field.name}") is not None
-    }
-    class_name = object.__class__.__name__
-    repr_string = f"{class_name}(" + ", ".join([f"{field}={value}" for field, value in populated_fields.items()]) + ")"
+    populated_fields = [
+        (field_name, value)
+        for field_name in _repr_field_names(type(object))
+        if (value := getattr(object, field_name)) is not None
+    ]
+    class_name = type(object).__name__
+    repr_string = f"{class_name}(" + ", ".join(f"{field}={value}" for field, value in populated_fields) + ")"
     return repr_string
 
 
+@functools.lru_cache(maxsize=None)
+def _repr_field_names(cls: type) -> tuple[str, ...]:
+    """
+    Returns the names of the fields of the dataclass 'cls' that are included in its repr.
+    """
+    return tuple(field.name for field in fields(cls) if field.repr)
+
+
 def _lookup_node(node_label: str, nodes: list[Node]) -> Optional[Node]:
     """
     Returns a Node object if 'node_label' is a match for node.label in 'nodes'.
     Returns None, otherwise.
+    Scans 'nodes' on every call; Beam resolves labels through an index instead.
     """
-    node = next((node for node in nodes if node.label == node_label)) or None
-    return node
+    return next(
+        (node for node in nodes if getattr(node.label, "text", None) == node_label), 
+        None
+    )
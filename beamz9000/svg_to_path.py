@@ -1,62 +1,207 @@
-
+import functools
+import itertools
+import math
+import os
 import pathlib
+from typing import Union
 import re
 import numpy as np
 from matplotlib.path import Path
 from matplotlib.patches import PathPatch
 import svgpathtools as svg
+try:
+    import svgelements
+except ImportError:
+    svgelements = None
+
 
+# Splits an SVG path string over its (single letter) commands
+_CMD_RE = re.compile("([A-Za-z])")
+# Matches each number in the values of an SVG path command, whether they are
+# separated by commas, whitespace or only by their +/- signs
+_NUM_RE = re.compile(r"[+-]?\d*\.?\d+(?:[eE][+-]?\d+)?")
+# The matplotlib.path.Path codes of the vertices of each supported SVG path command
+_SVG_COMMANDS = {
+    'M': (Path.MOVETO,),
+    'L': (Path.LINETO,),
+    'Q': (Path.CURVE3,)*2,
+    'C': (Path.CURVE4,)*3,
+    'Z': (Path.CLOSEPOLY,),
+}
 
-def load_svg_file(svg_filepath: pathlib.Path) -> list[Path]:
+
+def load_svg_file(svg_filepath: pathlib.Path) -> PathPatch:
     """
-    Returns a list of matplotlib.path.Path objects extracted from path data
+    Returns a new matplotlib.patches.PathPatch built from the path data
     contained in the SVG file of 'svg_filepath'.
+    The file is only parsed on the first call; subsequent calls re-use
+    the parsed vertices and codes.
     """
-    mpl_paths = []
-    paths, _attributes = svg.svg2paths(str(svg_filepath), convert_circles_to_paths=True)
-    for path in paths:
-        mpl_paths.append(
-                svg_path_parse(path.d())
-            )
-    return PathPatch(Path.make_compound_path(*mpl_paths))
+    vertices, codes = load_svg_path_data(svg_filepath)
+    return PathPatch(Path(vertices, codes))
 
 
-def svg_path_parse(svg_path: str):
+def load_svg_path_data(svg_filepath: Union[pathlib.Path, str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a tuple of (vertices, codes) arrays of the compound path extracted
+    from the path data contained in the SVG file of 'svg_filepath'.
+    The results are cached until the file is modified and the returned arrays
+    are read-only.
     """
-    Returns a matplotlib.path.Path object for an SVG path string describing
-    a single path.
+    resolved_filepath = os.fspath(pathlib.Path(svg_filepath).resolve())
+    return _load_svg_path_data(resolved_filepath, os.stat(resolved_filepath).st_mtime_ns)
 
-    Based on code from:
-    https://matplotlib.org/stable/gallery/showcase/firefox.html#sphx-glr-gallery-showcase-firefox-py
+
+@functools.lru_cache(maxsize=64)
+def _load_svg_path_data(svg_filepath: str, mtime_ns: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the (vertices, codes) of the SVG file at the absolute path 'svg_filepath'.
+    Cached on the path string so that equivalent paths share one entry, and on the
+    modification time of the file ('mtime_ns') so that an edited file is re-parsed.
+    """
+    if svgelements is not None:
+        # Parsed without applying the transforms (or the viewBox scaling) to the
+        # points so that the coordinates are the same as from svgpathtools
+        document = svgelements.SVG.parse(svg_filepath, reify=False, parse_display_none=True)
+        parsed_paths = [
+            svgelements_path_parse(svgelements.Path(element))
+            for element in document.elements()
+            if isinstance(element, svgelements.Shape)
+        ]
+    else:
+        paths, _attributes = svg.svg2paths(svg_filepath, convert_circles_to_paths=True)
+        parsed_paths = [svgpathtools_path_parse(path) for path in paths]
+    # Every path starts with a MOVETO so the compound path is the concatenation
+    # of the vertices and codes of each path
+    path_vertices = [np.empty((0, 2))]
+    path_codes = [np.empty(0, dtype=np.uint8)]
+    for vertices, codes in parsed_paths:
+        path_vertices.append(vertices)
+        path_codes.append(codes)
+    # SVG coordinates are in display units so two decimals is well below a pixel
+    vertices = np.round(np.concatenate(path_vertices), 2)
+    codes = np.concatenate(path_codes).astype(Path.code_type, copy=False)
+    vertices.flags.writeable = False
+    codes.flags.writeable = False
+    return vertices, codes
+
+
+def svgpathtools_path_parse(svg_path: svg.Path) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a tuple of (vertices, codes) arrays of a matplotlib.path.Path for an
+    svgpathtools.Path describing a single path.
+
+    The points are read directly from the segments of 'svg_path' rather than
+    from its path string (see svg_path_parse). A new sub-path is started
+    wherever a segment does not begin at the end of the previous one, as in
+    svgpathtools.Path.d(). Arcs are approximated by cubic Bézier curves of at
+    most 90 degrees each.
     """
-    commands = {'M': (Path.MOVETO,),
-                'L': (Path.LINETO,),
-                'Q': (Path.CURVE3,)*2,
-                'C': (Path.CURVE4,)*3,
-                'Z': (Path.CLOSEPOLY,)}
-    vertices = []
+    points = []
     codes = []
-    svg_path = svg_path.replace(" ", ",")
-    cmd_values = re.split("([A-Za-z])", svg_path)[1:]  # Split over commands.
-    for cmd, values in zip(cmd_values[::2], cmd_values[1::2]):
-        # Numbers are separated either by commas, or by +/- signs (but not at
-        # the beginning of the string).
-        if values:
-            points = [float(value) for value in re.split(r",|\s", values) if value]
-            if len(points) > 2:
-                points = list(zip(points[::2], points[1::2]))
+    current_pos = None
+    for segment in svg_path:
+        if segment.start != current_pos:
+            points.append(segment.start)
+            codes.append(Path.MOVETO)
+        if isinstance(segment, svg.Arc):
+            curves = segment.as_cubic_curves(max(1, math.ceil(abs(segment.delta) / 90)))
         else:
-            points = [(0., 0.)]
+            curves = (segment,)
+        for curve in curves:
+            if isinstance(curve, svg.Line):
+                points.append(curve.end)
+                codes.append(Path.LINETO)
+            elif isinstance(curve, svg.QuadraticBezier):
+                points.extend((curve.control, curve.end))
+                codes.extend((Path.CURVE3,)*2)
+            elif isinstance(curve, svg.CubicBezier):
+                points.extend((curve.control1, curve.control2, curve.end))
+                codes.extend((Path.CURVE4,)*3)
+        current_pos = segment.end
+    # svgpathtools stores points as complex numbers: x + yj
+    complex_points = np.asarray(points, dtype=np.complex128)
+    vertices_array = np.column_stack((complex_points.real, complex_points.imag))
+    codes_array = np.asarray(codes, dtype=np.uint8)
+    return vertices_array, codes_array
 
+
+def svgelements_path_parse(svg_path: "svgelements.Path") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a tuple of (vertices, codes) arrays of a matplotlib.path.Path for an
+    svgelements.Path describing a single path. Used in place of
+    svgpathtools_path_parse when the optional svgelements package is installed.
+
+    The points are read from the untransformed segments of 'svg_path'. As with
+    svgpathtools, a new sub-path is started wherever a segment does not begin at
+    the end of the previous one and a closing segment only adds a line if it
+    does not end at the current point. Arcs are approximated by cubic Bézier
+    curves of at most 90 degrees each.
+    """
+    flat_vertices = []
+    codes = []
+    current_pos = None
+    for segment in svg_path.segments(transformed=False):
+        if isinstance(segment, svgelements.Move):
+            continue
+        if isinstance(segment, svgelements.Close) and segment.start == segment.end:
+            continue
+        if segment.start != current_pos:
+            flat_vertices.extend((segment.start.x, segment.start.y))
+            codes.append(Path.MOVETO)
+        if isinstance(segment, svgelements.Arc):
+            curves = segment.as_cubic_curves(max(1, math.ceil(abs(math.degrees(segment.sweep)) / 90)))
+        else:
+            curves = (segment,)
+        for curve in curves:
+            if isinstance(curve, svgelements.Linear):
+                flat_vertices.extend((curve.end.x, curve.end.y))
+                codes.append(Path.LINETO)
+            elif isinstance(curve, svgelements.QuadraticBezier):
+                flat_vertices.extend((curve.control.x, curve.control.y, curve.end.x, curve.end.y))
+                codes.extend((Path.CURVE3,)*2)
+            elif isinstance(curve, svgelements.CubicBezier):
+                flat_vertices.extend(
+                    (
+                        curve.control1.x, curve.control1.y, 
+                        curve.control2.x, curve.control2.y, 
+                        curve.end.x, curve.end.y,
+                    )
+                )
+                codes.extend((Path.CURVE4,)*3)
+        current_pos = segment.end
+    vertices_array = np.asarray(flat_vertices, dtype=np.float64).reshape(-1, 2)
+    codes_array = np.asarray(codes, dtype=np.uint8)
+    return vertices_array, codes_array
+
+
+def svg_path_parse(svg_path: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a tuple of (vertices, codes) arrays of a matplotlib.path.Path for an
+    SVG path string describing a single path, e.g. Path(*svg_path_parse(svg_path)).
+
+    Based on code from:
+    https://matplotlib.org/stable/gallery/showcase/firefox.html#sphx-glr-gallery-showcase-firefox-py
+    """
+    flat_vertices = []
+    last_x, last_y = 0., 0.
+    cmd_values = _CMD_RE.split(svg_path)[1:]  # Split over commands.
+    cmds = cmd_values[::2]
+    # The codes only depend on the commands so they are written in one go into
+    # an array of the final size
+    cmd_codes = [_SVG_COMMANDS[cmd.upper()] for cmd in cmds]
+    codes_array = np.fromiter(
+        itertools.chain.from_iterable(cmd_codes), 
+        dtype=np.uint8, 
+        count=sum(map(len, cmd_codes))
+    )
+    for cmd, values in zip(cmds, cmd_values[1::2]):
+        points = list(map(float, _NUM_RE.findall(values))) or [0., 0.]
         if cmd.islower() and cmd != 'm':
-            points += vertices[-1][-1]
-        codes.extend(commands[cmd.upper()])
-        vertices.append(
-            np.reshape(
-                np.array(points), 
-                (-1, 2)
-            )
-        )
-    codes_array = np.array(codes)
-    vertices_array = np.concatenate(vertices)
-    return Path(vertices_array, codes_array)
+            # Relative coordinates are offset by the last point
+            points[0::2] = [x + last_x for x in points[0::2]]
+            points[1::2] = [y + last_y for y in points[1::2]]
+        flat_vertices.extend(points)
+        last_x, last_y = points[-2], points[-1]
+    vertices_array = np.asarray(flat_vertices, dtype=np.float64).reshape(-1, 2)
+    return vertices_array, codes_array